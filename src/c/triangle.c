@@ -14910,4 +14910,22 @@ int triangulate(char *triswitches, struct triangulateio *in,
     return errno;
   }
 }
+
+// run triangulate() on n independent inputs in one call; `vorout' may be
+// NULL when the `v' switch is not used.  Stops at the first failure and
+// returns its status; outputs not yet reached are left untouched.
+int triangulate_batch(char *triswitches, int n, struct triangulateio *in,
+                      struct triangulateio *out, struct triangulateio *vorout)
+{
+  int i, status;
+
+  for (i = 0; i < n; i++) {
+    status = triangulate(triswitches, &in[i], &out[i],
+                         vorout == NULL ? NULL : &vorout[i]);
+    if (status != 0) {
+      return status;
+    }
+  }
+  return 0;
+}
 #endif /* TRILIBRARY */
@@ -287,6 +287,8 @@ struct triangulateio {
 
 int triangulate(char *, struct triangulateio *, struct triangulateio *,
                  struct triangulateio *);
+int triangulate_batch(char *, int, struct triangulateio *,
+                      struct triangulateio *, struct triangulateio *);
 void trifree(VOID *memptr);
 
 #ifdef __cplusplus
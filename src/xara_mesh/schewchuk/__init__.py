@@ -1,3 +1,3 @@
-from .core import CyTriangle, triangulate     # re-export
-__all__ = ["CyTriangle", "triangulate"]
+from .core import CyTriangle, triangulate, triangulate_batch     # re-export
+__all__ = ["CyTriangle", "triangulate", "triangulate_batch"]
 
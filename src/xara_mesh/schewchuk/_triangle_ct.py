@@ -3,8 +3,9 @@ Pure-ctypes bridge to Jonathan Shewchuk’s Triangle
 """
 from __future__ import annotations
 from ctypes import *
+from functools import lru_cache
 from pathlib import Path
-import numpy as np
+import sys
 
 
 
@@ -19,54 +20,74 @@ def _lib_path() -> str:
         name = "triangle_lib.dll"
     return str(_pkg_dir / name)
 
-_lib = CDLL(_lib_path())
-
 
 # _lib = CDLL(str(Path(__file__).with_suffix("").with_name("libtriangle.so")))
 
-REAL = c_double
-c_int_p    = POINTER(c_int)
-c_real_p   = POINTER(REAL)
-
 class TriangulateIO(Structure):
+    # pointer fields are untyped (REAL* / int* in triangle.h): they are set
+    # from raw integer addresses and only given a type when read out
     _fields_ = [                                           # ↱ header order
-        ("pointlist",            c_real_p),                #   |
-        ("pointattributelist",   c_real_p),                #   |
-        ("pointmarkerlist",      c_int_p ),                #   |
+        ("pointlist",            c_void_p),                #   |
+        ("pointattributelist",   c_void_p),                #   |
+        ("pointmarkerlist",      c_void_p),                #   |
         ("numberofpoints",       c_int  ),                 #   |
         ("numberofpointattributes", c_int),                #   |
-        ("trianglelist",         c_int_p),                 #   |
-        ("triangleattributelist",c_real_p),                #   |
-        ("trianglearealist",     c_real_p),                #   |
-        ("neighborlist",         c_int_p),                 #   |
+        ("trianglelist",         c_void_p),                #   |
+        ("triangleattributelist",c_void_p),                #   |
+        ("trianglearealist",     c_void_p),                #   |
+        ("neighborlist",         c_void_p),                #   |
         ("numberoftriangles",    c_int  ),                 #   |
         ("numberofcorners",      c_int  ),                 #   |
         ("numberoftriangleattributes", c_int),             #   |
-        ("segmentlist",          c_int_p),                 #   |
-        ("segmentmarkerlist",    c_int_p),                 #   |
+        ("segmentlist",          c_void_p),                #   |
+        ("segmentmarkerlist",    c_void_p),                #   |
         ("numberofsegments",     c_int  ),                 #   |
-        ("holelist",             c_real_p),                #   |
+        ("holelist",             c_void_p),                #   |
         ("numberofholes",        c_int  ),                 #   |
-        ("regionlist",           c_real_p),                #   |
+        ("regionlist",           c_void_p),                #   |
         ("numberofregions",      c_int  ),                 #   |
-        ("edgelist",             c_int_p),                 #   |
-        ("edgemarkerlist",       c_int_p),                 #   |
-        ("normlist",             c_real_p),                #   |
+        ("edgelist",             c_void_p),                #   |
+        ("edgemarkerlist",       c_void_p),                #   |
+        ("normlist",             c_void_p),                #   |
         ("numberofedges",        c_int  ),                 #
     ]
 
 #
-# prototypes
+# prototypes (library is loaded on first use, not at import)
 #
-_triangulate = _lib.triangulate
-_triangulate.argtypes = [c_char_p,
-                         POINTER(TriangulateIO),
-                         POINTER(TriangulateIO),
-                         POINTER(TriangulateIO)]
-_triangulate.restype  = c_int      # Triangle returns 0 on success
+@lru_cache(maxsize=None)
+def _get_lib():
+    lib = CDLL(_lib_path())
+
+    triangulate = lib.triangulate
+    triangulate.argtypes = [c_char_p,
+                            POINTER(TriangulateIO),
+                            POINTER(TriangulateIO),
+                            POINTER(TriangulateIO)]
+    triangulate.restype  = c_int      # Triangle returns 0 on success
+
+    trifree = lib.trifree
+    trifree.argtypes = [c_void_p]
+    trifree.restype  = None
+    return lib, triangulate, trifree
+
+def _get_triangulate():
+    return _get_lib()[1]
+
+def _get_trifree():
+    return _get_lib()[2]
 
-_trifree = _lib.trifree
-_trifree.argtypes = [c_void_p]
-_trifree.restype  = None
+# resolved on its own so that a library built without triangulate_batch
+# only breaks triangulate_batch(), not triangulate() / trifree()
+@lru_cache(maxsize=None)
+def _get_triangulate_batch():
+    triangulate_batch = _get_lib()[0].triangulate_batch
+    triangulate_batch.argtypes = [c_char_p,
+                                  c_int,
+                                  POINTER(TriangulateIO),
+                                  POINTER(TriangulateIO),
+                                  POINTER(TriangulateIO)]   # may be NULL
+    triangulate_batch.restype  = c_int
+    return triangulate_batch
 
 
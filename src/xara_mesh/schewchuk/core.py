@@ -2,16 +2,30 @@
 Pure-Python replacement for cytriangle.CyTriangle
 """
 from __future__ import annotations
-from ctypes import byref
-from ._triangle_ct import _triangulate
+from ctypes import c_char_p
+from functools import lru_cache
+from ._triangle_ct import TriangulateIO, _get_triangulate, _get_triangulate_batch
 from .trio import TriangleIO
-import re
+
+# bound triangulate() from the shared library, filled in by the first run
+_triangulate = None
+
+def _load_triangulate():
+    global _triangulate
+    _triangulate = _get_triangulate()
+    return _triangulate
 
 class CyTriangle:
     def __init__(self, input_dict=None):
         self._in   = TriangleIO(input_dict)
         self._out  = TriangleIO()
-        self._vor  = TriangleIO()
+        self._vor  = None              # created on first 'v' run
+
+    def set_input(self, input_dict):
+        """replace the input in place; int casts of same-shaped triangles /
+        segments reuse the previous buffers (remesh loops)"""
+        self._in.release()            # zero struct, drop owners, keep _scratch
+        self._in._from_dict(input_dict)
 
     # ------------------------------------------------ validation identical --
     @staticmethod
@@ -19,23 +33,59 @@ class CyTriangle:
         if "r" in opts and "triangles" not in opts:
             pass  # keep original logic if you want
 
+    # ------------------------------------------------ switch encoding -----
+    # bounded: remesh loops that vary a<area>/q<angle> must not grow it
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _switches(extra_flags: str, verbose=False) -> c_char_p:
+        """pre-encoded switch string for triangulate()"""
+        return c_char_p((('V' if verbose else 'Q') + 'z' + extra_flags).encode())
+
     # ------------------------------------------------ internal dispatcher ---
-    def _run(self, extra_flags: str, verbose=False):
-        opts = (('V' if verbose else 'Q') + 'z' + extra_flags).encode()
-        status = _triangulate(opts,
-                              byref(self._in._io),
-                              byref(self._out._io),
-                              byref(self._vor._io))
+    def _run(self, extra_flags: str, verbose=False, reuse=False):
+        opts = self._switches(extra_flags, verbose)
+        # Triangle writes into any output field that is already non-NULL, so
+        # a used output struct must never be passed in again as-is.
+        if reuse:
+            self._out.release()
+        elif self._out._c_to_free:
+            self._out = TriangleIO()
+        # Voronoi output is only wanted with 'v'; otherwise pass vorout=NULL
+        # (Triangle checks for it) and skip collecting it.
+        voronoi = 'v' in extra_flags
+        if voronoi:
+            if self._vor is None:
+                self._vor = TriangleIO()
+            elif reuse:
+                self._vor.release()
+            elif self._vor._c_to_free:
+                self._vor = TriangleIO()
+            vor_ref = self._vor._io_ref
+        else:
+            vor_ref = None
+        tri = _triangulate or _load_triangulate()   # library loads lazily
+        status = tri(opts,
+                     self._in._io_ref,
+                     self._out._io_ref,
+                     vor_ref)
+        # collect before checking status: Triangle may have malloc'd some
+        # output before it bailed out, and those must still be trifree()'d
+        self._out.collect_after_call()
+        if voronoi:
+            self._vor.collect_after_call()
         if status != 0:
             raise RuntimeError(f"triangulate() returned {status}")
-        self._out.collect_after_call()
-        self._vor.collect_after_call()
         return self._out
 
     # ------------------------------------------------ public API ------------
     def triangulate(self, flags='', verbose=False):
         return self._run(flags, verbose)
 
+    def triangulate_reuse(self, flags='', verbose=False):
+        """like triangulate(), but frees the previous output in place and
+        reuses its struct; earlier results from this instance become invalid"""
+        return self._run(flags, verbose, reuse=True)
+
     def delaunay(self, verbose=False):
         return self._run('', verbose)
 
@@ -51,3 +101,26 @@ def triangulate(input_dict, flags):
     tri.triangulate(flags)
     return tri._out.to_dict(np_fmt=True)
 
+def triangulate_batch(input_dicts, flags):
+    """triangulate() many independent inputs with a single FFI call"""
+    ins = [TriangleIO(d) for d in input_dicts]   # keep input buffers alive
+    n   = len(ins)
+    if n == 0:
+        return []
+    in_arr  = (TriangulateIO * n)(*(t._io for t in ins))
+    out_arr = (TriangulateIO * n)()
+    vor_arr = (TriangulateIO * n)() if 'v' in flags else None
+    status  = _get_triangulate_batch()(CyTriangle._switches(flags, False), n,
+                                       in_arr, out_arr, vor_arr)
+    # collect every slot, even after a failure, so nothing Triangle
+    # allocated is leaked; untouched slots are all-NULL
+    outs = [TriangleIO._adopt(out_arr[i]) for i in range(n)]
+    for o in outs:
+        o.collect_after_call()
+    if vor_arr is not None:
+        for i in range(n):
+            TriangleIO._adopt(vor_arr[i]).collect_after_call()
+    if status != 0:
+        raise RuntimeError(f"triangulate_batch() returned {status}")
+    return [o.to_dict(np_fmt=True) for o in outs]
+
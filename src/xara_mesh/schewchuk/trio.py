@@ -10,99 +10,153 @@ Responsible for:
 """
 from __future__ import annotations
 import numpy as np
-from ctypes import c_int, c_double, c_void_p, POINTER, sizeof, byref
-from ._triangle_ct import TriangulateIO, _trifree, REAL
-
-c_int_p   = POINTER(c_int)
-c_real_p  = POINTER(REAL)
+from ctypes import c_byte, sizeof, byref, addressof, memset
+from operator import attrgetter
+from ._triangle_ct import TriangulateIO, _get_trifree
+
+# pointer fields Triangle may malloc in an output struct (with 'p' this
+# tree's triangle.c also malloc's copies of holelist / regionlist)
+_OUT_FIELDS = ("pointlist","pointattributelist","pointmarkerlist",
+               "trianglelist","triangleattributelist","trianglearealist",
+               "neighborlist","segmentlist","segmentmarkerlist",
+               "holelist","regionlist","edgelist","edgemarkerlist",
+               "normlist")
+_out_ptrs = attrgetter(*_OUT_FIELDS)    # one call → tuple of all pointers
+
+def _as_c(x, dtype):
+    """C-contiguous view of *x* as *dtype*; copy only when we have to"""
+    a = np.asarray(x)
+    if a.dtype == dtype and a.flags.c_contiguous:
+        return a
+    return np.ascontiguousarray(a, dtype=dtype)
+
+def _wrap(addr: int, shape, dtype):
+    """zero-copy ndarray view of a C array (no ctypes type walking)"""
+    dtype = np.dtype(dtype)
+    n   = int(np.prod(shape))
+    buf = (c_byte * (n * dtype.itemsize)).from_address(addr)
+    return np.frombuffer(buf, dtype=dtype).reshape(shape)
 
 class TriangleIO:
     # --------------------------------------------------------------------- #
 
     def __init__(self, d: dict | None = None) -> None:
         self._io = TriangulateIO()     # all fields NULL/0 by default
-        self._py_buffers: list[np.ndarray] = []   # own numpy → avoid GC
-        self._c_to_free:  list[c_void_p]   = []   # Triangle-malloc’d output
+        self._io_ref = byref(self._io)  # built once, reused for every call
+        self._owners: dict[str, np.ndarray] = {}  # field → numpy, avoid GC
+        self._c_to_free:  list[int]        = []   # Triangle-malloc’d output
+        self._scratch: dict[str, np.ndarray] = {} # reusable cast buffers
         if d:
             self._from_dict(d)
 
+    @classmethod
+    def _adopt(cls, io: TriangulateIO) -> "TriangleIO":
+        """wrap an already-filled struct (e.g. one slot of a batch array)"""
+        self = cls()
+        self._io     = io
+        self._io_ref = byref(io)
+        return self
+
     # ------------------ convenience -------------------------------------- #
-    def _keep(self, arr: np.ndarray) -> c_real_p | c_int_p:
-        """keep numpy buffer alive and return pointer cast for struct"""
-        self._py_buffers.append(arr)
-        return arr.ctypes.data_as(c_real_p if arr.dtype == np.float64 else c_int_p)
+    def _keep(self, field: str, arr: np.ndarray) -> int:
+        """keep numpy buffer alive as owner of *field*; return its address
+        for the (untyped, c_void_p) struct field"""
+        self._owners[field] = arr
+        # __array_interface__ is a plain tuple lookup; arr.ctypes builds a
+        # fresh _ctypes helper object on every access
+        return arr.__array_interface__["data"][0]
+
+    def _as_c_scratch(self, field: str, x, dtype) -> np.ndarray:
+        """like _as_c(), but a needed cast is copied into a per-field buffer
+        that is reused while the shape stays the same (remesh loops)"""
+        a = np.asarray(x)
+        if a.dtype == dtype and a.flags.c_contiguous:
+            return a
+        buf = self._scratch.get(field)
+        if buf is not None and buf.shape == a.shape:
+            np.copyto(buf, a, casting="unsafe")
+            return buf
+        buf = self._scratch[field] = np.ascontiguousarray(a, dtype=dtype)
+        return buf
 
     # ------------------ Setters used in old .pyx ------------------------- #
+    # the shape / length checks bound what Triangle reads through the
+    # numberof* counts, so they stay on even under `python -O`
     ## vertices ##
     def set_vertices(self, verts):
-        verts = np.ascontiguousarray(verts, dtype=np.float64)
+        verts = _as_c(verts, np.float64)
         if verts.ndim != 2 or verts.shape[1] != 2:
             raise ValueError("vertices must be (N,2) array-like")
         self._io.numberofpoints = verts.shape[0]
-        self._io.pointlist      = self._keep(verts)
+        self._io.pointlist      = self._keep("pointlist", verts)
 
     ## optional per-vertex ##
     def set_vertex_attributes(self, attr):
-        attr = np.ascontiguousarray(attr, dtype=np.float64)
+        attr = _as_c(attr, np.float64)
         if attr.shape[0] != self._io.numberofpoints:
             raise ValueError("vertex_attributes length mismatch")
         self._io.numberofpointattributes = attr.shape[1]
-        self._io.pointattributelist      = self._keep(attr)
+        self._io.pointattributelist      = self._keep("pointattributelist", attr)
 
     def set_vertex_markers(self, mk):
-        mk = np.ascontiguousarray(mk, dtype=np.int32)
+        mk = _as_c(mk, np.int32)
         if mk.size != self._io.numberofpoints:
             raise ValueError("vertex_markers length mismatch")
-        self._io.pointmarkerlist = self._keep(mk)
+        self._io.pointmarkerlist = self._keep("pointmarkerlist", mk)
 
     ## triangles + per-triangle ##
     def set_triangles(self, tris):
-        tris = np.ascontiguousarray(tris, dtype=np.int32)
+        tris = self._as_c_scratch("trianglelist", tris, np.int32)
         self._io.numberoftriangles = tris.shape[0]
         self._io.numberofcorners   = tris.shape[1]
-        self._io.trianglelist      = self._keep(tris)
+        self._io.trianglelist      = self._keep("trianglelist", tris)
 
     def set_triangle_attributes(self, attr):
-        attr = np.ascontiguousarray(attr, dtype=np.float64)
+        attr = _as_c(attr, np.float64)
         if attr.shape[0] != self._io.numberoftriangles:
             raise ValueError("triangle_attributes length mismatch")
         self._io.numberoftriangleattributes = attr.shape[1]
-        self._io.triangleattributelist      = self._keep(attr)
+        self._io.triangleattributelist      = self._keep("triangleattributelist", attr)
 
     def set_triangle_areas(self, a):
-        a = np.ascontiguousarray(a, dtype=np.float64)
+        a = _as_c(a, np.float64)
         if a.size != self._io.numberoftriangles:
             raise ValueError("triangle_max_area length mismatch")
-        self._io.trianglearealist = self._keep(a)
+        self._io.trianglearealist = self._keep("trianglearealist", a)
 
     ## segments / holes / regions (similar but shorter checks) ##
     def set_segments(self, seg):
-        seg = np.ascontiguousarray(seg, dtype=np.int32)
+        seg = self._as_c_scratch("segmentlist", seg, np.int32)
         if seg.shape[1] != 2:
             raise ValueError("segments must be (N,2)")
         self._io.numberofsegments = seg.shape[0]
-        self._io.segmentlist      = self._keep(seg)
+        self._io.segmentlist      = self._keep("segmentlist", seg)
 
     def set_segment_markers(self, mk):
-        mk = np.ascontiguousarray(mk, dtype=np.int32)
+        mk = _as_c(mk, np.int32)
         if mk.size != self._io.numberofsegments:
             raise ValueError("segment_markers length mismatch")
-        self._io.segmentmarkerlist = self._keep(mk)
+        self._io.segmentmarkerlist = self._keep("segmentmarkerlist", mk)
 
     def set_holes(self, holes):
-        holes = np.ascontiguousarray(holes, dtype=np.float64)
+        holes = _as_c(holes, np.float64)
         if holes.shape[1] != 2:
             raise ValueError("holes must be (N,2)")
         self._io.numberofholes = holes.shape[0]
-        self._io.holelist      = self._keep(holes)
+        self._io.holelist      = self._keep("holelist", holes)
 
     def set_regions(self, regs):
         # expect list[dict] as in old wrapper
-        arr = np.empty((len(regs), 4), np.float64)
-        for i,r in enumerate(regs):
-            arr[i] = [r["vertex"][0], r["vertex"][1], r["marker"], r["max_area"]]
+        # packed [x, y, marker, max_area] rows as Triangle expects; filled
+        # column-wise so each column is one vectorized block copy
+        n   = len(regs)
+        arr = np.empty((n, 4), np.float64)
+        arr[:, 0:2] = np.asarray([r["vertex"] for r in regs],
+                                 dtype=np.float64).reshape(n, 2)
+        arr[:, 2]   = np.fromiter((r["marker"]   for r in regs), np.float64, n)
+        arr[:, 3]   = np.fromiter((r["max_area"] for r in regs), np.float64, n)
         self._io.numberofregions = arr.shape[0]
-        self._io.regionlist      = self._keep(arr)
+        self._io.regionlist      = self._keep("regionlist", arr)
 
     # ------------------ dict ↔︎ struct helpers --------------------------- #
     def _from_dict(self, d):
@@ -126,15 +180,13 @@ class TriangleIO:
     def to_dict(self, np_fmt: bool = False):
         out = {}
         if self._io.pointlist:
-            pts = np.ctypeslib.as_array(
-                self._io.pointlist,
-                shape=(self._io.numberofpoints, 2))
+            pts = _wrap(self._io.pointlist,
+                        (self._io.numberofpoints, 2), np.float64)
             out["vertices"] = pts.copy() if np_fmt else pts.tolist()
         if self._io.trianglelist:
-            tris = np.ctypeslib.as_array(
-                self._io.trianglelist,
-                shape=(self._io.numberoftriangles,
-                       self._io.numberofcorners))
+            tris = _wrap(self._io.trianglelist,
+                         (self._io.numberoftriangles,
+                          self._io.numberofcorners), np.int32)
             out["triangles"] = tris.copy() if np_fmt else tris.tolist()
         # add other arrays exactly the way you need them
         return out
@@ -149,17 +201,25 @@ class TriangleIO:
         to remember which arrays Triangle allocated"""
         # Triangulate may allocate lots of arrays; record pointers that
         # are currently non-NULL but **not** owned by Python.
-        io = self._io
-        for name in ("pointlist","pointattributelist","pointmarkerlist",
-                     "trianglelist","triangleattributelist","trianglearealist",
-                     "neighborlist","segmentlist","segmentmarkerlist",
-                     "holelist","regionlist","edgelist","edgemarkerlist",
-                     "normlist"):
-            ptr = getattr(io, name)
-            if ptr and not any(ptr == buf.ctypes.data for buf in self._py_buffers):
+        owners = self._owners
+        for name, ptr in zip(_OUT_FIELDS, _out_ptrs(self._io)):
+            if ptr and name not in owners:      # c_void_p fields read as int/None
                 self._take_cptr(ptr)
 
+    def release(self):
+        """trifree() Triangle-malloc’d output and zero the struct so it can
+        be handed to triangulate() again as a fresh output"""
+        if self._c_to_free:
+            trifree = _get_trifree()
+            for p in self._c_to_free:
+                trifree(p)
+            self._c_to_free.clear()
+        self._owners.clear()
+        memset(addressof(self._io), 0, sizeof(TriangulateIO))
+
     def __del__(self):
-        for p in self._c_to_free:
-            _trifree(p)
+        if self._c_to_free:
+            trifree = _get_trifree()
+            for p in self._c_to_free:
+                trifree(p)
 
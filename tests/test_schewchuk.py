@@ -0,0 +1,147 @@
+import gc
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from xara_mesh.schewchuk import _triangle_ct
+
+try:
+    _triangle_ct._get_lib()
+except OSError:                                  # Triangle library not built
+    pytest.skip("Triangle shared library not available", allow_module_level=True)
+
+from xara_mesh.schewchuk import CyTriangle, triangulate, triangulate_batch
+from xara_mesh.schewchuk import trio
+from xara_mesh.schewchuk._triangle_ct import TriangulateIO
+
+# every pointer field of the struct, independent of what trio.py scans
+_PTR_FIELDS = [name for name, typ in TriangulateIO._fields_
+               if typ is _triangle_ct.c_void_p]
+
+
+SQUARE = {
+    "vertices": [[0, 0], [3, 0], [3, 3], [0, 3], [1, 1], [2, 1], [2, 2], [1, 2]],
+    "segments": [[0, 1], [1, 2], [2, 3], [3, 0], [4, 5], [5, 6], [6, 7], [7, 4]],
+    "holes":    [[1.5, 1.5]],
+    "regions":  [{"vertex": [0.5, 0.5], "marker": 3, "max_area": 0.1}],
+}
+
+
+def _untracked(tio):
+    """non-NULL output pointers that would never be trifree()'d"""
+    ptrs = {getattr(tio._io, name) for name in _PTR_FIELDS} - {None}
+    return ptrs - set(tio._c_to_free)
+
+
+def test_triangulate_reuse_p_does_not_leak():
+    tri = CyTriangle(SQUARE)
+    first = tri.triangulate_reuse("pq").to_dict(np_fmt=True)
+    for _ in range(20):
+        out = tri.triangulate_reuse("pq")
+        assert out is tri._out
+        assert out._io.holelist and out._io.regionlist
+        assert not _untracked(out)
+        assert len(out._c_to_free) == len(set(out._c_to_free))
+    last = out.to_dict(np_fmt=True)
+    np.testing.assert_array_equal(first["triangles"], last["triangles"])
+
+
+def _random_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{"vertices": rng.random((10 + 3 * i, 2))} for i in range(n)]
+
+
+@pytest.mark.parametrize("flags", ["", "pq", "v"])
+def test_triangulate_batch_matches_triangulate(flags):
+    inputs = _random_inputs(20) + [SQUARE]
+    batch = triangulate_batch(inputs, flags)
+    assert len(batch) == len(inputs)
+    for got, d in zip(batch, inputs):
+        want = triangulate(d, flags)
+        assert got.keys() == want.keys()
+        for key in want:
+            np.testing.assert_array_equal(got[key], want[key])
+
+
+def test_triangulate_batch_empty():
+    assert triangulate_batch([], "q") == []
+
+
+@pytest.fixture
+def freed(monkeypatch):
+    """addresses passed to trifree() while the test runs"""
+    addrs = []
+    real  = trio._get_trifree()
+    def trifree(p):
+        addrs.append(p)
+        real(p)
+    monkeypatch.setattr(trio, "_get_trifree", lambda: trifree)
+    return addrs
+
+
+def test_triangulate_batch_failure_frees_outputs(freed):
+    good, = _random_inputs(1)
+    bad   = {"vertices": [[0.0, 0.0], [1.0, 1.0]]}   # < 3 vertices
+    with pytest.raises(RuntimeError):
+        triangulate_batch([good, bad, good], "")
+    gc.collect()
+    # the first slot was triangulated before the failure; its output
+    # (at least points and triangles) must have gone back to trifree()
+    assert len(freed) >= 2
+    assert len(freed) == len(set(freed))
+
+
+def test_triangulate_failure_raises():
+    tri = CyTriangle({"vertices": [[0.0, 0.0], [1.0, 1.0]]})
+    with pytest.raises(RuntimeError):
+        tri.triangulate("")
+
+
+def test_set_input_reuses_cast_buffers():
+    base = triangulate(SQUARE, "pqa0.2")
+    verts, tris = base["vertices"], base["triangles"].astype(np.int64)
+    tri = CyTriangle({"vertices": verts, "triangles": tris})
+    first = tri.triangulate("r").to_dict(np_fmt=True)
+    buf = tri._in._owners["trianglelist"]
+    for scale in (2.0, 3.0):
+        tri.set_input({"vertices": verts * scale, "triangles": tris})
+        assert tri._in._owners["trianglelist"] is buf
+        out = tri.triangulate("r").to_dict(np_fmt=True)
+        np.testing.assert_array_equal(out["triangles"], first["triangles"])
+        np.testing.assert_allclose(out["vertices"], first["vertices"] * scale)
+
+
+def test_length_checks_survive_optimize():
+    # under -O a missing check turns a bad shape into an out-of-bounds read
+    code = ("from xara_mesh.schewchuk.trio import TriangleIO\n"
+            "try:\n"
+            "    TriangleIO({'vertices': [0.0, 0.0, 1.0, 0.0, 0.0, 1.0]})\n"
+            "except ValueError:\n"
+            "    raise SystemExit(0)\n"
+            "raise SystemExit(1)\n")
+    assert subprocess.run([sys.executable, "-O", "-c", code]).returncode == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs the C runtime's malloc")
+def test_failed_run_still_collects_outputs(monkeypatch):
+    import ctypes
+    from xara_mesh.schewchuk import core
+    malloc = ctypes.CDLL(None).malloc
+    malloc.restype, malloc.argtypes = ctypes.c_void_p, [ctypes.c_size_t]
+
+    def failing(opts, in_ref, out_ref, vor_ref):
+        # stand-in for a triexit() after Triangle started writing output
+        out_ref._obj.pointlist = malloc(16)
+        return 1
+
+    tri = CyTriangle(SQUARE)
+    monkeypatch.setattr(core, "_triangulate", failing)
+    with pytest.raises(RuntimeError):
+        tri.triangulate("p")
+    failed = tri._out
+    assert failed._c_to_free == [failed._io.pointlist]
+    monkeypatch.undo()
+    out = tri.triangulate("p")
+    assert out is not failed